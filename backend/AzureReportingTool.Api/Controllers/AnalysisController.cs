@@ -37,7 +37,7 @@ public class AnalysisController : ControllerBase
             }
             
             // Fetch Azure resources
-            var resources = await _azureFetcher.FetchAllResourcesAsync(request.SubscriptionId);
+            var resources = await _azureFetcher.FetchAllResourcesAsync(request.SubscriptionId, request.ForceRefresh);
             _logger.LogInformation("Fetched {Count} resources", resources.Count);
             
             // Analyze resources
@@ -57,5 +57,6 @@ public class AnalysisController : ControllerBase
 public class AnalysisRequest
 {
     public string SubscriptionId { get; set; } = string.Empty;
+    public bool ForceRefresh { get; set; }
     public AnalysisSettings Settings { get; set; } = new();
 }
@@ -1,4 +1,5 @@
 using AzureReportingTool.Core.Services;
+using Azure.Core;
 using Azure.Identity;
 using Azure.ResourceManager;
 
@@ -25,9 +26,19 @@ builder.Services.AddCors(options =>
 builder.Services.AddSingleton<ArmClient>(sp => 
 {
     var credential = new DefaultAzureCredential();
-    return new ArmClient(credential);
+    var options = new ArmClientOptions();
+    // Retry throttled (429) and transient 5xx ARM responses with exponential backoff
+    options.Retry.Mode = RetryMode.Exponential;
+    options.Retry.MaxRetries = 5;
+    options.Retry.Delay = TimeSpan.FromSeconds(1);
+    options.Retry.MaxDelay = TimeSpan.FromSeconds(30);
+    return new ArmClient(credential, default, options);
 });
 
+// Cache fetched Azure resources between analysis runs
+builder.Services.AddMemoryCache();
+builder.Services.Configure<AzureFetcherOptions>(builder.Configuration.GetSection(AzureFetcherOptions.SectionName));
+
 // Register application services
 builder.Services.AddScoped<IAzureFetcherService, AzureFetcherService>();
 builder.Services.AddScoped<IAnalysisService, AnalysisService>();
@@ -19,14 +19,22 @@ public class AnalysisService : IAnalysisService
     private const int SCORE_HIGH_STRENGTH_THRESHOLD = 2;
     private const int SCORE_LOW_WEAKNESS_MULTIPLIER = 2;
     
+    // Resource type markers used to bucket resources
+    private const string VIRTUAL_MACHINE_TYPE = "Microsoft.Compute/virtualMachines";
+    private const string STORAGE_ACCOUNT_TYPE = "Microsoft.Storage/storageAccounts";
+    private const string NETWORK_SECURITY_GROUP_TYPE = "Microsoft.Network/networkSecurityGroups";
+    private const string VIRTUAL_NETWORK_TYPE = "Microsoft.Network/virtualNetworks";
+    
     public async Task<AnalysisResult> AnalyzeResourcesAsync(List<AzureResource> resources, AnalysisSettings settings)
     {
+        // Bucket resources once up front; the cost, AI and pillar passes all read from the same inventory
+        var inventory = ResourceInventory.Build(resources);
         var result = new AnalysisResult
         {
             Statistics = new Dictionary<string, object>
             {
                 ["TotalResources"] = resources.Count,
-                ["ResourceTypes"] = resources.Select(r => r.Type).Distinct().Count()
+                ["ResourceTypes"] = inventory.ResourceTypeCount
             }
         };
         
@@ -37,14 +45,14 @@ public class AnalysisService : IAnalysisService
         }
         
         // Perform cost analysis
-        result.CostAnalysis = PerformCostAnalysis(resources);
+        result.CostAnalysis = PerformCostAnalysis(resources, inventory);
         
         // AI analysis if enabled
         if (settings.AiEnabled)
         {
-            result.ExecutiveSummary = await GenerateAISummaryAsync(resources, settings);
-            result.ExecutiveSummaryPillars = GeneratePillarBasedSummary(resources, result);
-            result.Findings.AddRange(await GenerateAIFindingsAsync(resources, settings));
+            result.ExecutiveSummary = await GenerateAISummaryAsync(resources, inventory.ResourceTypeCount, settings);
+            result.ExecutiveSummaryPillars = GeneratePillarBasedSummary(resources, inventory, result);
+            result.Findings.AddRange(await GenerateAIFindingsAsync(inventory, settings));
         }
         
         // Add findings from tag and cost analysis
@@ -59,9 +67,10 @@ public class AnalysisService : IAnalysisService
         }
         
         // Update statistics
+        var (criticalFindings, highFindings) = CountSeverities(result.Findings);
         result.Statistics["TotalFindings"] = result.Findings.Count;
-        result.Statistics["CriticalFindings"] = result.Findings.Count(f => f.Severity == "Critical");
-        result.Statistics["HighFindings"] = result.Findings.Count(f => f.Severity == "High");
+        result.Statistics["CriticalFindings"] = criticalFindings;
+        result.Statistics["HighFindings"] = highFindings;
         
         return result;
     }
@@ -71,60 +80,64 @@ public class AnalysisService : IAnalysisService
         var result = new TagComplianceResult
         {
             TotalResources = resources.Count,
-            ResourcesWithTags = resources.Count(r => r.Tags.Any()),
             RequiredTags = settings.RequiredTags
         };
         
+        // Invalid values are matched case-insensitively, as configured values such as "TBD" are meant to be
+        var invalidTagValues = new HashSet<string>(settings.InvalidTagValues, StringComparer.OrdinalIgnoreCase);
+        var resourceGroups = new Dictionary<string, ResourceGroupCompliance>();
+        
+        // Evaluate each resource once and feed both the overall and the per-resource-group figures
+        var taggedCount = 0;
         var compliantCount = 0;
         foreach (var resource in resources)
         {
-            var missingTags = settings.RequiredTags.Where(tag => !resource.Tags.ContainsKey(tag)).ToList();
-            var invalidTags = resource.Tags
-                .Where(kvp => settings.InvalidTagValues.Contains(kvp.Value.ToLower()))
-                .ToList();
+            if (resource.Tags.Count > 0)
+            {
+                taggedCount++;
+            }
+            
+            var hasRequiredTags = settings.RequiredTags.All(resource.Tags.ContainsKey);
+            var hasInvalidTags = resource.Tags.Values.Any(invalidTagValues.Contains);
             
-            if (missingTags.Count == 0 && invalidTags.Count == 0)
+            if (hasRequiredTags && !hasInvalidTags)
             {
                 compliantCount++;
             }
+            
+            if (!resourceGroups.TryGetValue(resource.ResourceGroup, out var rg))
+            {
+                rg = new ResourceGroupCompliance { Name = resource.ResourceGroup };
+                resourceGroups.Add(resource.ResourceGroup, rg);
+                result.ResourceGroups.Add(rg);
+            }
+            
+            // Resource group compliance only considers missing tags
+            rg.TotalResources++;
+            if (!hasRequiredTags)
+            {
+                rg.NonCompliantResources++;
+            }
         }
         
+        result.ResourcesWithTags = taggedCount;
         result.ComplianceRate = resources.Count > 0 ? (int)((compliantCount * 100.0) / resources.Count) : 100;
         
-        // Group by resource group
-        var resourceGroups = resources.GroupBy(r => r.ResourceGroup);
-        foreach (var rg in resourceGroups)
+        foreach (var rg in result.ResourceGroups)
         {
-            var rgCompliant = 0;
-            foreach (var resource in rg)
-            {
-                var missingTags = settings.RequiredTags.Where(tag => !resource.Tags.ContainsKey(tag)).ToList();
-                if (missingTags.Count == 0)
-                {
-                    rgCompliant++;
-                }
-            }
-            
-            var rgTotal = rg.Count();
-            result.ResourceGroups.Add(new ResourceGroupCompliance
-            {
-                Name = rg.Key,
-                TotalResources = rgTotal,
-                NonCompliantResources = rgTotal - rgCompliant,
-                ComplianceRate = rgTotal > 0 ? (int)((rgCompliant * 100.0) / rgTotal) : 100
-            });
+            var rgCompliant = rg.TotalResources - rg.NonCompliantResources;
+            rg.ComplianceRate = rg.TotalResources > 0 ? (int)((rgCompliant * 100.0) / rg.TotalResources) : 100;
         }
         
         return result;
     }
     
-    private CostAnalysisResult PerformCostAnalysis(List<AzureResource> resources)
+    private CostAnalysisResult PerformCostAnalysis(List<AzureResource> resources, ResourceInventory inventory)
     {
         var findings = new List<Finding>();
         
         // Analyze VMs
-        var vms = resources.Where(r => r.Type.Contains("Microsoft.Compute/virtualMachines")).ToList();
-        foreach (var vm in vms)
+        foreach (var vm in inventory.VirtualMachines)
         {
             if (!vm.Tags.ContainsKey("CostCenter"))
             {
@@ -141,32 +154,52 @@ public class AnalysisService : IAnalysisService
             }
         }
         
+        var (criticalFindings, highFindings) = CountSeverities(findings);
         return new CostAnalysisResult
         {
             TotalResourcesAnalyzed = resources.Count,
             TotalFindings = findings.Count,
-            ImmediateActions = findings.Count(f => f.Severity == "Critical"),
-            ReviewsNeeded = findings.Count(f => f.Severity == "High"),
+            ImmediateActions = criticalFindings,
+            ReviewsNeeded = highFindings,
             Findings = findings
         };
     }
     
-    private async Task<string> GenerateAISummaryAsync(List<AzureResource> resources, AnalysisSettings settings)
+    private static (int Critical, int High) CountSeverities(List<Finding> findings)
+    {
+        var critical = 0;
+        var high = 0;
+        foreach (var finding in findings)
+        {
+            if (finding.Severity == "Critical")
+            {
+                critical++;
+            }
+            else if (finding.Severity == "High")
+            {
+                high++;
+            }
+        }
+        
+        return (critical, high);
+    }
+    
+    private async Task<string> GenerateAISummaryAsync(List<AzureResource> resources, int resourceTypeCount, AnalysisSettings settings)
     {
         // Simplified - in production, would use OpenAI API
         await Task.CompletedTask;
-        return $"Analysis of {resources.Count} Azure resources across {resources.Select(r => r.Type).Distinct().Count()} resource types. " +
+        return $"Analysis of {resources.Count} Azure resources across {resourceTypeCount} resource types. " +
                "The environment shows a mix of compute, storage, and networking resources that require security and cost optimization review.";
     }
     
-    private async Task<List<Finding>> GenerateAIFindingsAsync(List<AzureResource> resources, AnalysisSettings settings)
+    private async Task<List<Finding>> GenerateAIFindingsAsync(ResourceInventory inventory, AnalysisSettings settings)
     {
         // Simplified - in production, would use OpenAI API
         await Task.CompletedTask;
         var findings = new List<Finding>();
         
         // Generate sample findings
-        var vms = resources.Where(r => r.Type.Contains("Microsoft.Compute/virtualMachines")).Take(3);
+        var vms = inventory.VirtualMachines.Take(3);
         foreach (var vm in vms)
         {
             findings.Add(new Finding
@@ -187,40 +220,35 @@ public class AnalysisService : IAnalysisService
     
     private ExecutiveSummaryPillars GeneratePillarBasedSummary(
         List<AzureResource> resources, 
+        ResourceInventory inventory,
         AnalysisResult analysisResult)
     {
         var pillars = new ExecutiveSummaryPillars();
         
         // Security Pillar Analysis
-        pillars.Security = AnalyzeSecurityPillar(resources, analysisResult);
+        pillars.Security = AnalyzeSecurityPillar(inventory, analysisResult);
         
         // Cost Optimization Pillar Analysis
-        pillars.CostOptimization = AnalyzeCostOptimizationPillar(resources, analysisResult);
+        pillars.CostOptimization = AnalyzeCostOptimizationPillar(resources, inventory, analysisResult);
         
         // Operational Excellence Pillar Analysis
-        pillars.OperationalExcellence = AnalyzeOperationalExcellencePillar(resources, analysisResult);
+        pillars.OperationalExcellence = AnalyzeOperationalExcellencePillar(resources, inventory, analysisResult);
         
         // Reliability Pillar Analysis
-        pillars.Reliability = AnalyzeReliabilityPillar(resources, analysisResult);
+        pillars.Reliability = AnalyzeReliabilityPillar(inventory, analysisResult);
         
         // Performance Efficiency Pillar Analysis
-        pillars.PerformanceEfficiency = AnalyzePerformanceEfficiencyPillar(resources, analysisResult);
+        pillars.PerformanceEfficiency = AnalyzePerformanceEfficiencyPillar(inventory, analysisResult);
         
         return pillars;
     }
     
-    private PillarSummary AnalyzeSecurityPillar(List<AzureResource> resources, AnalysisResult analysisResult)
+    private PillarSummary AnalyzeSecurityPillar(ResourceInventory inventory, AnalysisResult analysisResult)
     {
-        var summary = new PillarSummary
-        {
-            Name = "Security",
-            Overview = "Security pillar focuses on protecting applications and data through defense in depth, identity management, network security, and data protection strategies aligned with Microsoft Cloud Adoption Framework (CAF) and Well-Architected Framework (WAF)."
-        };
-        
         // Analyze security aspects
-        var nsgs = resources.Where(r => r.Type.Contains("Microsoft.Network/networkSecurityGroups")).ToList();
-        var vms = resources.Where(r => r.Type.Contains("Microsoft.Compute/virtualMachines")).ToList();
-        var storageAccounts = resources.Where(r => r.Type.Contains("Microsoft.Storage/storageAccounts")).ToList();
+        var nsgs = inventory.NetworkSecurityGroups;
+        var vms = inventory.VirtualMachines;
+        var storageAccounts = inventory.StorageAccounts;
         
         var strengths = new List<string>();
         var weaknesses = new List<string>();
@@ -252,41 +280,25 @@ public class AnalysisService : IAnalysisService
             recommendations.Add("Ensure all storage accounts have 'Secure transfer required' enabled and are configured with appropriate firewall rules and Private Endpoints where applicable.");
         }
         
-        // Overall assessment
-        var securityScore = CalculateScore(strengths.Count, weaknesses.Count);
-        summary.Score = securityScore;
-        
-        summary.CurrentState = securityScore switch
-        {
-            "High" => "The environment demonstrates strong security controls with comprehensive network protection, proper access management, and data protection measures in place. However, continuous monitoring and improvement are essential.",
-            "Medium" => "The environment has basic security controls in place but requires significant improvements to meet CAF/WAF security best practices. Critical areas such as network isolation, identity management, and data protection need attention.",
-            _ => "The environment shows significant security gaps that require immediate attention. Fundamental security controls are missing or inadequately configured, exposing the environment to substantial security risks."
-        };
-        
-        summary.Strengths = strengths;
-        summary.Weaknesses = weaknesses;
-        summary.Recommendations = recommendations;
-        
-        return summary;
+        return BuildPillarSummary(
+            "Security",
+            "Security pillar focuses on protecting applications and data through defense in depth, identity management, network security, and data protection strategies aligned with Microsoft Cloud Adoption Framework (CAF) and Well-Architected Framework (WAF).",
+            strengths,
+            weaknesses,
+            recommendations,
+            highState: "The environment demonstrates strong security controls with comprehensive network protection, proper access management, and data protection measures in place. However, continuous monitoring and improvement are essential.",
+            mediumState: "The environment has basic security controls in place but requires significant improvements to meet CAF/WAF security best practices. Critical areas such as network isolation, identity management, and data protection need attention.",
+            lowState: "The environment shows significant security gaps that require immediate attention. Fundamental security controls are missing or inadequately configured, exposing the environment to substantial security risks.");
     }
     
-    private PillarSummary AnalyzeCostOptimizationPillar(List<AzureResource> resources, AnalysisResult analysisResult)
+    private PillarSummary AnalyzeCostOptimizationPillar(List<AzureResource> resources, ResourceInventory inventory, AnalysisResult analysisResult)
     {
-        var summary = new PillarSummary
-        {
-            Name = "Cost Optimization",
-            Overview = "Cost optimization pillar focuses on managing costs to maximize value delivered, including proper resource sizing, eliminating waste, and leveraging Azure cost management tools as recommended by Microsoft CAF and WAF."
-        };
-        
         var strengths = new List<string>();
         var weaknesses = new List<string>();
         var recommendations = new List<string>();
         
         // Analyze tagging for cost allocation
-        var resourcesWithCostTags = resources.Count(r => 
-            r.Tags.ContainsKey("CostCenter") || 
-            r.Tags.ContainsKey("Department") || 
-            r.Tags.ContainsKey("Project"));
+        var resourcesWithCostTags = inventory.CostTaggedCount;
         
         if (resources.Count > 0 && resourcesWithCostTags > resources.Count * COST_TAG_COMPLIANCE_THRESHOLD)
         {
@@ -299,7 +311,7 @@ public class AnalysisService : IAnalysisService
         }
         
         // Analyze VMs for potential optimization
-        var vms = resources.Where(r => r.Type.Contains("Microsoft.Compute/virtualMachines")).ToList();
+        var vms = inventory.VirtualMachines;
         if (vms.Any())
         {
             weaknesses.Add($"{vms.Count} virtual machines detected - potential candidates for rightsizing analysis and Azure Hybrid Benefit.");
@@ -309,47 +321,32 @@ public class AnalysisService : IAnalysisService
         }
         
         // Analyze storage accounts
-        var storageAccounts = resources.Where(r => r.Type.Contains("Microsoft.Storage/storageAccounts")).ToList();
+        var storageAccounts = inventory.StorageAccounts;
         if (storageAccounts.Any())
         {
             weaknesses.Add($"{storageAccounts.Count} storage accounts detected - verify appropriate storage tiers and lifecycle management policies are configured.");
             recommendations.Add("Review storage account access tiers (Hot, Cool, Archive) and implement lifecycle management policies to automatically transition data to lower-cost tiers.");
         }
         
-        var costScore = CalculateScore(strengths.Count, weaknesses.Count);
-        summary.Score = costScore;
-        
-        summary.CurrentState = costScore switch
-        {
-            "High" => "The environment demonstrates excellent cost management practices with comprehensive tagging, appropriate resource sizing, and proactive cost optimization measures in place.",
-            "Medium" => "The environment has basic cost management controls but lacks comprehensive cost optimization strategies. Significant opportunities exist for cost reduction through better tagging, rightsizing, and leveraging Azure cost management features.",
-            _ => "The environment shows poor cost management practices with limited visibility into cost allocation and numerous opportunities for optimization. Immediate action is needed to implement cost controls and monitoring."
-        };
-        
-        summary.Strengths = strengths;
-        summary.Weaknesses = weaknesses;
-        summary.Recommendations = recommendations;
-        
-        return summary;
+        return BuildPillarSummary(
+            "Cost Optimization",
+            "Cost optimization pillar focuses on managing costs to maximize value delivered, including proper resource sizing, eliminating waste, and leveraging Azure cost management tools as recommended by Microsoft CAF and WAF.",
+            strengths,
+            weaknesses,
+            recommendations,
+            highState: "The environment demonstrates excellent cost management practices with comprehensive tagging, appropriate resource sizing, and proactive cost optimization measures in place.",
+            mediumState: "The environment has basic cost management controls but lacks comprehensive cost optimization strategies. Significant opportunities exist for cost reduction through better tagging, rightsizing, and leveraging Azure cost management features.",
+            lowState: "The environment shows poor cost management practices with limited visibility into cost allocation and numerous opportunities for optimization. Immediate action is needed to implement cost controls and monitoring.");
     }
     
-    private PillarSummary AnalyzeOperationalExcellencePillar(List<AzureResource> resources, AnalysisResult analysisResult)
+    private PillarSummary AnalyzeOperationalExcellencePillar(List<AzureResource> resources, ResourceInventory inventory, AnalysisResult analysisResult)
     {
-        var summary = new PillarSummary
-        {
-            Name = "Operational Excellence",
-            Overview = "Operational excellence pillar covers operational practices and procedures used to manage production workloads, including automation, monitoring, incident response, and continuous improvement as defined in Microsoft CAF and WAF."
-        };
-        
         var strengths = new List<string>();
         var weaknesses = new List<string>();
         var recommendations = new List<string>();
         
         // Analyze tagging for operational management
-        var resourcesWithOpTags = resources.Count(r => 
-            r.Tags.ContainsKey("Environment") || 
-            r.Tags.ContainsKey("Owner") || 
-            r.Tags.ContainsKey("Application"));
+        var resourcesWithOpTags = inventory.OperationalTaggedCount;
         
         if (resources.Count > 0 && resourcesWithOpTags > resources.Count * OPERATIONAL_TAG_COMPLIANCE_THRESHOLD)
         {
@@ -362,7 +359,7 @@ public class AnalysisService : IAnalysisService
         }
         
         // Resource groups analysis
-        var resourceGroups = resources.Select(r => r.ResourceGroup).Distinct().Count();
+        var resourceGroups = inventory.ResourceGroupCount;
         if (resourceGroups > 0)
         {
             strengths.Add($"Resources organized into {resourceGroups} resource groups, providing logical grouping for management operations.");
@@ -375,37 +372,25 @@ public class AnalysisService : IAnalysisService
         recommendations.Add("Implement Infrastructure as Code (IaC) using ARM templates, Bicep, or Terraform for consistent and repeatable deployments.");
         recommendations.Add("Establish automated backup and disaster recovery procedures aligned with business requirements.");
         
-        var opScore = CalculateScore(strengths.Count, weaknesses.Count);
-        summary.Score = opScore;
-        
-        summary.CurrentState = opScore switch
-        {
-            "High" => "The environment shows strong operational practices with good resource organization, comprehensive tagging, and structured management approach. Continuing to mature automation and monitoring capabilities will further enhance operational excellence.",
-            "Medium" => "The environment has foundational operational practices in place but requires enhancement in areas such as monitoring, automation, and standardization to fully align with CAF/WAF operational excellence principles.",
-            _ => "The environment demonstrates limited operational maturity with insufficient monitoring, automation, and standardization. Significant investment in operational practices and tooling is required to improve manageability and reduce operational overhead."
-        };
-        
-        summary.Strengths = strengths;
-        summary.Weaknesses = weaknesses;
-        summary.Recommendations = recommendations;
-        
-        return summary;
+        return BuildPillarSummary(
+            "Operational Excellence",
+            "Operational excellence pillar covers operational practices and procedures used to manage production workloads, including automation, monitoring, incident response, and continuous improvement as defined in Microsoft CAF and WAF.",
+            strengths,
+            weaknesses,
+            recommendations,
+            highState: "The environment shows strong operational practices with good resource organization, comprehensive tagging, and structured management approach. Continuing to mature automation and monitoring capabilities will further enhance operational excellence.",
+            mediumState: "The environment has foundational operational practices in place but requires enhancement in areas such as monitoring, automation, and standardization to fully align with CAF/WAF operational excellence principles.",
+            lowState: "The environment demonstrates limited operational maturity with insufficient monitoring, automation, and standardization. Significant investment in operational practices and tooling is required to improve manageability and reduce operational overhead.");
     }
     
-    private PillarSummary AnalyzeReliabilityPillar(List<AzureResource> resources, AnalysisResult analysisResult)
+    private PillarSummary AnalyzeReliabilityPillar(ResourceInventory inventory, AnalysisResult analysisResult)
     {
-        var summary = new PillarSummary
-        {
-            Name = "Reliability",
-            Overview = "Reliability pillar focuses on the ability of a system to recover from failures and continue to function, including aspects of resiliency, availability, disaster recovery, and backup as outlined in Microsoft CAF and WAF."
-        };
-        
         var strengths = new List<string>();
         var weaknesses = new List<string>();
         var recommendations = new List<string>();
         
         // Analyze resource distribution
-        var locations = resources.Select(r => r.Location).Distinct().Count();
+        var locations = inventory.LocationCount;
         if (locations > 1)
         {
             strengths.Add($"Resources deployed across {locations} Azure regions, providing geographic distribution for improved resilience.");
@@ -417,7 +402,7 @@ public class AnalysisService : IAnalysisService
         }
         
         // Analyze VMs
-        var vms = resources.Where(r => r.Type.Contains("Microsoft.Compute/virtualMachines")).ToList();
+        var vms = inventory.VirtualMachines;
         if (vms.Any())
         {
             weaknesses.Add($"{vms.Count} virtual machines require validation of availability set/zone configuration, backup policies, and disaster recovery setup.");
@@ -427,7 +412,7 @@ public class AnalysisService : IAnalysisService
         }
         
         // Analyze storage
-        var storageAccounts = resources.Where(r => r.Type.Contains("Microsoft.Storage/storageAccounts")).ToList();
+        var storageAccounts = inventory.StorageAccounts;
         if (storageAccounts.Any())
         {
             weaknesses.Add($"{storageAccounts.Count} storage accounts require verification of replication strategy (LRS, GRS, RA-GRS, ZRS).");
@@ -439,41 +424,29 @@ public class AnalysisService : IAnalysisService
         recommendations.Add("Define and test disaster recovery procedures regularly, including RTO and RPO targets.");
         recommendations.Add("Use Azure Traffic Manager or Azure Front Door for global load balancing and automatic failover.");
         
-        var reliabilityScore = CalculateScore(strengths.Count, weaknesses.Count);
-        summary.Score = reliabilityScore;
-        
-        summary.CurrentState = reliabilityScore switch
-        {
-            "High" => "The environment demonstrates strong reliability characteristics with appropriate redundancy, geographic distribution, and disaster recovery capabilities. Continue to test and refine recovery procedures to maintain high availability.",
-            "Medium" => "The environment has basic reliability measures in place but lacks comprehensive disaster recovery and high availability configurations. Improvements are needed to meet CAF/WAF reliability standards for production workloads.",
-            _ => "The environment shows significant reliability gaps with limited redundancy, lack of disaster recovery capabilities, and insufficient backup strategies. Immediate action is required to improve system resilience and protect against data loss."
-        };
-        
-        summary.Strengths = strengths;
-        summary.Weaknesses = weaknesses;
-        summary.Recommendations = recommendations;
-        
-        return summary;
+        return BuildPillarSummary(
+            "Reliability",
+            "Reliability pillar focuses on the ability of a system to recover from failures and continue to function, including aspects of resiliency, availability, disaster recovery, and backup as outlined in Microsoft CAF and WAF.",
+            strengths,
+            weaknesses,
+            recommendations,
+            highState: "The environment demonstrates strong reliability characteristics with appropriate redundancy, geographic distribution, and disaster recovery capabilities. Continue to test and refine recovery procedures to maintain high availability.",
+            mediumState: "The environment has basic reliability measures in place but lacks comprehensive disaster recovery and high availability configurations. Improvements are needed to meet CAF/WAF reliability standards for production workloads.",
+            lowState: "The environment shows significant reliability gaps with limited redundancy, lack of disaster recovery capabilities, and insufficient backup strategies. Immediate action is required to improve system resilience and protect against data loss.");
     }
     
-    private PillarSummary AnalyzePerformanceEfficiencyPillar(List<AzureResource> resources, AnalysisResult analysisResult)
+    private PillarSummary AnalyzePerformanceEfficiencyPillar(ResourceInventory inventory, AnalysisResult analysisResult)
     {
-        var summary = new PillarSummary
-        {
-            Name = "Performance Efficiency",
-            Overview = "Performance efficiency pillar focuses on the ability to scale resources to meet demand efficiently, including selecting the right resource types and sizes, monitoring performance, and optimizing for efficiency as guided by Microsoft CAF and WAF."
-        };
-        
         var strengths = new List<string>();
         var weaknesses = new List<string>();
         var recommendations = new List<string>();
         
         // Analyze resource types
-        var resourceTypes = resources.Select(r => r.Type).Distinct().Count();
+        var resourceTypes = inventory.ResourceTypeCount;
         strengths.Add($"Environment utilizes {resourceTypes} different Azure resource types, indicating diverse workload support.");
         
         // Analyze VMs
-        var vms = resources.Where(r => r.Type.Contains("Microsoft.Compute/virtualMachines")).ToList();
+        var vms = inventory.VirtualMachines;
         if (vms.Any())
         {
             weaknesses.Add($"{vms.Count} virtual machines detected - performance monitoring and auto-scaling configuration require verification.");
@@ -483,7 +456,7 @@ public class AnalysisService : IAnalysisService
         }
         
         // Analyze storage
-        var storageAccounts = resources.Where(r => r.Type.Contains("Microsoft.Storage/storageAccounts")).ToList();
+        var storageAccounts = inventory.StorageAccounts;
         if (storageAccounts.Any())
         {
             weaknesses.Add($"{storageAccounts.Count} storage accounts require performance tier validation and consideration of Premium storage for high-performance workloads.");
@@ -491,7 +464,7 @@ public class AnalysisService : IAnalysisService
         }
         
         // Analyze networks
-        var vnets = resources.Where(r => r.Type.Contains("Microsoft.Network/virtualNetworks")).ToList();
+        var vnets = inventory.VirtualNetworks;
         if (vnets.Any())
         {
             strengths.Add($"{vnets.Count} virtual networks configured, enabling network segmentation and optimized traffic routing.");
@@ -503,21 +476,44 @@ public class AnalysisService : IAnalysisService
         recommendations.Add("Use Application Gateway or Azure Load Balancer to distribute traffic and improve application responsiveness.");
         recommendations.Add("Configure auto-scaling policies based on performance metrics to handle variable workloads efficiently.");
         
-        var perfScore = CalculateScore(strengths.Count, weaknesses.Count);
-        summary.Score = perfScore;
+        return BuildPillarSummary(
+            "Performance Efficiency",
+            "Performance efficiency pillar focuses on the ability to scale resources to meet demand efficiently, including selecting the right resource types and sizes, monitoring performance, and optimizing for efficiency as guided by Microsoft CAF and WAF.",
+            strengths,
+            weaknesses,
+            recommendations,
+            highState: "The environment demonstrates strong performance efficiency characteristics with appropriate resource selection, good network design, and consideration for scalability. Continue monitoring and optimizing based on performance metrics.",
+            mediumState: "The environment has adequate performance capabilities but would benefit from enhanced monitoring, optimization of resource types, and implementation of auto-scaling capabilities to fully align with CAF/WAF performance efficiency principles.",
+            lowState: "The environment shows performance efficiency gaps with potential resource sizing issues, lack of performance monitoring, and limited scalability mechanisms. Performance optimization efforts are needed to ensure workloads meet business requirements.");
+    }
+    
+    private PillarSummary BuildPillarSummary(
+        string name,
+        string overview,
+        List<string> strengths,
+        List<string> weaknesses,
+        List<string> recommendations,
+        string highState,
+        string mediumState,
+        string lowState)
+    {
+        var score = CalculateScore(strengths.Count, weaknesses.Count);
         
-        summary.CurrentState = perfScore switch
+        return new PillarSummary
         {
-            "High" => "The environment demonstrates strong performance efficiency characteristics with appropriate resource selection, good network design, and consideration for scalability. Continue monitoring and optimizing based on performance metrics.",
-            "Medium" => "The environment has adequate performance capabilities but would benefit from enhanced monitoring, optimization of resource types, and implementation of auto-scaling capabilities to fully align with CAF/WAF performance efficiency principles.",
-            _ => "The environment shows performance efficiency gaps with potential resource sizing issues, lack of performance monitoring, and limited scalability mechanisms. Performance optimization efforts are needed to ensure workloads meet business requirements."
+            Name = name,
+            Overview = overview,
+            Score = score,
+            CurrentState = score switch
+            {
+                "High" => highState,
+                "Medium" => mediumState,
+                _ => lowState
+            },
+            Strengths = strengths,
+            Weaknesses = weaknesses,
+            Recommendations = recommendations
         };
-        
-        summary.Strengths = strengths;
-        summary.Weaknesses = weaknesses;
-        summary.Recommendations = recommendations;
-        
-        return summary;
     }
     
     private string CalculateScore(int strengthCount, int weaknessCount)
@@ -553,4 +549,67 @@ public class AnalysisService : IAnalysisService
         
         return findings;
     }
+    
+    // Per-category resource buckets and distinct counts used by the analysis passes, built in a single traversal
+    private sealed class ResourceInventory
+    {
+        public List<AzureResource> VirtualMachines { get; } = new();
+        public List<AzureResource> StorageAccounts { get; } = new();
+        public List<AzureResource> NetworkSecurityGroups { get; } = new();
+        public List<AzureResource> VirtualNetworks { get; } = new();
+        public int ResourceTypeCount { get; private set; }
+        public int LocationCount { get; private set; }
+        public int ResourceGroupCount { get; private set; }
+        public int CostTaggedCount { get; private set; }
+        public int OperationalTaggedCount { get; private set; }
+        
+        public static ResourceInventory Build(List<AzureResource> resources)
+        {
+            var inventory = new ResourceInventory();
+            var resourceTypes = new HashSet<string>();
+            var locations = new HashSet<string>();
+            var resourceGroups = new HashSet<string>();
+            foreach (var resource in resources)
+            {
+                resourceTypes.Add(resource.Type);
+                locations.Add(resource.Location);
+                resourceGroups.Add(resource.ResourceGroup);
+                
+                if (resource.Tags.ContainsKey("CostCenter") || 
+                    resource.Tags.ContainsKey("Department") || 
+                    resource.Tags.ContainsKey("Project"))
+                {
+                    inventory.CostTaggedCount++;
+                }
+                if (resource.Tags.ContainsKey("Environment") || 
+                    resource.Tags.ContainsKey("Owner") || 
+                    resource.Tags.ContainsKey("Application"))
+                {
+                    inventory.OperationalTaggedCount++;
+                }
+                
+                if (resource.Type.Contains(VIRTUAL_MACHINE_TYPE))
+                {
+                    inventory.VirtualMachines.Add(resource);
+                }
+                if (resource.Type.Contains(STORAGE_ACCOUNT_TYPE))
+                {
+                    inventory.StorageAccounts.Add(resource);
+                }
+                if (resource.Type.Contains(NETWORK_SECURITY_GROUP_TYPE))
+                {
+                    inventory.NetworkSecurityGroups.Add(resource);
+                }
+                if (resource.Type.Contains(VIRTUAL_NETWORK_TYPE))
+                {
+                    inventory.VirtualNetworks.Add(resource);
+                }
+            }
+            
+            inventory.ResourceTypeCount = resourceTypes.Count;
+            inventory.LocationCount = locations.Count;
+            inventory.ResourceGroupCount = resourceGroups.Count;
+            return inventory;
+        }
+    }
 }
@@ -3,62 +3,129 @@ using Azure.Identity;
 using Azure.ResourceManager;
 using Azure.ResourceManager.Resources;
 using AzureReportingTool.Core.Models;
+using Microsoft.Extensions.Caching.Memory;
 using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
 
 namespace AzureReportingTool.Core.Services;
 
 public interface IAzureFetcherService
 {
-    Task<List<AzureResource>> FetchAllResourcesAsync(string subscriptionId);
+    Task<List<AzureResource>> FetchAllResourcesAsync(string subscriptionId, bool forceRefresh = false);
 }
 
 public class AzureFetcherService : IAzureFetcherService
 {
     public const string AllSubscriptionsIdentifier = "all";
     
+    // Upper bound on concurrent subscription listings to stay clear of ARM read throttling
+    private const int MaxConcurrentSubscriptionFetches = 8;
+    
     private readonly ArmClient _armClient;
+    private readonly IMemoryCache _cache;
+    private readonly AzureFetcherOptions _options;
     private readonly ILogger<AzureFetcherService> _logger;
 
-    public AzureFetcherService(ArmClient armClient, ILogger<AzureFetcherService> logger)
+    public AzureFetcherService(
+        ArmClient armClient,
+        IMemoryCache cache,
+        IOptions<AzureFetcherOptions> options,
+        ILogger<AzureFetcherService> logger)
     {
         _armClient = armClient;
+        _cache = cache;
+        _options = options.Value;
         _logger = logger;
     }
 
-    public async Task<List<AzureResource>> FetchAllResourcesAsync(string subscriptionId)
+    public async Task<List<AzureResource>> FetchAllResourcesAsync(string subscriptionId, bool forceRefresh = false)
+    {
+        var cacheDuration = TimeSpan.FromSeconds(_options.ResourceCacheSeconds);
+        var cacheKey = $"resources:{subscriptionId.ToLowerInvariant()}";
+        
+        if (!forceRefresh && cacheDuration > TimeSpan.Zero &&
+            _cache.TryGetValue(cacheKey, out List<AzureResource>? cached) && cached != null)
+        {
+            _logger.LogInformation("Using cached resources for subscription: {SubscriptionId}", subscriptionId);
+            // Hand out a copy so callers cannot modify the cached list
+            return new List<AzureResource>(cached);
+        }
+        
+        var (resources, isComplete) = await FetchResourcesFromArmAsync(subscriptionId);
+        // A run that skipped a subscription is incomplete; don't let it stand in for later runs
+        if (cacheDuration > TimeSpan.Zero && isComplete)
+        {
+            _cache.Set(cacheKey, new List<AzureResource>(resources), cacheDuration);
+        }
+        
+        return resources;
+    }
+
+    private async Task<(List<AzureResource> Resources, bool IsComplete)> FetchResourcesFromArmAsync(string subscriptionId)
     {
         var resources = new List<AzureResource>();
+        var isComplete = true;
         
         // If subscriptionId is "all", iterate through all subscriptions
         if (subscriptionId.Equals(AllSubscriptionsIdentifier, StringComparison.OrdinalIgnoreCase))
         {
+            var subscriptions = new List<SubscriptionResource>();
             await foreach (var subscription in _armClient.GetSubscriptions().GetAllAsync())
             {
-                try
-                {
-                    _logger.LogInformation("Fetching resources from subscription: {SubscriptionId}", subscription.Data.SubscriptionId);
-                    
-                    await foreach (var resource in subscription.GetGenericResourcesAsync())
-                    {
-                        resources.Add(MapToAzureResource(resource));
-                    }
-                }
-                catch (Exception ex)
+                subscriptions.Add(subscription);
+            }
+            
+            // Subscriptions are independent, so list them concurrently and merge in enumeration order
+            using var throttle = new SemaphoreSlim(MaxConcurrentSubscriptionFetches);
+            var results = await Task.WhenAll(subscriptions.Select(s => FetchSubscriptionResourcesOrNullAsync(s, throttle)));
+            foreach (var subscriptionResources in results)
+            {
+                if (subscriptionResources == null)
                 {
-                    _logger.LogWarning(ex, "Failed to fetch resources from subscription {SubscriptionId}. Skipping this subscription.", subscription.Data.SubscriptionId);
-                    // Continue with the next subscription instead of failing the entire operation
+                    isComplete = false;
+                    continue;
                 }
+                
+                resources.AddRange(subscriptionResources);
             }
         }
         else
         {
             // Single subscription case
             var subscription = _armClient.GetSubscriptionResource(new ResourceIdentifier($"/subscriptions/{subscriptionId}"));
-            
-            await foreach (var resource in subscription.GetGenericResourcesAsync())
-            {
-                resources.Add(MapToAzureResource(resource));
-            }
+            resources.AddRange(await FetchSubscriptionResourcesAsync(subscription));
+        }
+        
+        return (resources, isComplete);
+    }
+
+    private async Task<List<AzureResource>?> FetchSubscriptionResourcesOrNullAsync(SubscriptionResource subscription, SemaphoreSlim throttle)
+    {
+        await throttle.WaitAsync();
+        try
+        {
+            _logger.LogInformation("Fetching resources from subscription: {SubscriptionId}", subscription.Data.SubscriptionId);
+            return await FetchSubscriptionResourcesAsync(subscription);
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "Failed to fetch resources from subscription {SubscriptionId}. Skipping this subscription.", subscription.Data.SubscriptionId);
+            // Continue with the other subscriptions instead of failing the entire operation
+            return null;
+        }
+        finally
+        {
+            throttle.Release();
+        }
+    }
+
+    private static async Task<List<AzureResource>> FetchSubscriptionResourcesAsync(SubscriptionResource subscription)
+    {
+        var resources = new List<AzureResource>();
+        
+        await foreach (var resource in subscription.GetGenericResourcesAsync())
+        {
+            resources.Add(MapToAzureResource(resource));
         }
         
         return resources;
@@ -77,3 +144,11 @@ public class AzureFetcherService : IAzureFetcherService
         };
     }
 }
+
+public class AzureFetcherOptions
+{
+    public const string SectionName = "AzureFetcher";
+    
+    // How long fetched resources are reused before ARM is queried again; 0 (the default) disables caching
+    public int ResourceCacheSeconds { get; set; } = 0;
+}
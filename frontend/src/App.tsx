@@ -141,6 +141,32 @@ interface Subscription {
   is_default: boolean;
 }
 
+type SeverityColor = 'error' | 'warning' | 'info' | 'success' | 'default';
+
+// Chip color per finding severity, keyed by lowercase severity. A Map keeps keys such as
+// "constructor" from resolving to Object.prototype members.
+const SEVERITY_COLORS = new Map<string, SeverityColor>([
+  ['critical', 'error'],
+  ['high', 'warning'],
+  ['medium', 'info'],
+  ['low', 'success'],
+]);
+
+const getSeverityColor = (severity: string): SeverityColor =>
+  SEVERITY_COLORS.get(severity.toLowerCase()) ?? 'default';
+
+type ScoreColor = 'success' | 'warning' | 'error' | 'info';
+
+// Chip color per pillar score, keyed by lowercase score
+const SCORE_COLORS = new Map<string, ScoreColor>([
+  ['high', 'success'],
+  ['medium', 'warning'],
+  ['low', 'error'],
+]);
+
+const getScoreColor = (score: string): ScoreColor =>
+  SCORE_COLORS.get(score.toLowerCase()) ?? 'info';
+
 function App() {
   const [subscriptionId, setSubscriptionId] = useState(DEFAULT_SUBSCRIPTION_ID);
   const [subscriptions, setSubscriptions] = useState<Subscription[]>([]);
@@ -241,34 +267,6 @@ function App() {
     }
   };
 
-  const getSeverityColor = (severity: string): 'error' | 'warning' | 'info' | 'success' | 'default' => {
-    switch (severity.toLowerCase()) {
-      case 'critical':
-        return 'error';
-      case 'high':
-        return 'warning';
-      case 'medium':
-        return 'info';
-      case 'low':
-        return 'success';
-      default:
-        return 'default';
-    }
-  };
-
-  const getScoreColor = (score: string): 'success' | 'warning' | 'error' | 'info' => {
-    switch (score.toLowerCase()) {
-      case 'high':
-        return 'success';
-      case 'medium':
-        return 'warning';
-      case 'low':
-        return 'error';
-      default:
-        return 'info';
-    }
-  };
-
   const renderPillarSummary = (pillar: PillarSummary) => {
     return (
       <Accordion key={pillar.name} defaultExpanded>